@@ -1,8 +1,4 @@
 import streamlit as st
-import pandas as pd
-from pulp import *
-# Removed: import matplotlib.pyplot as plt
-# Removed: import numpy as np
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -11,139 +7,199 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# --- Title and Introduction ---
-st.title("Optimizing Scheduling with Linear Programming")
-st.markdown("---")
-st.write(
-    "This application demonstrates how Linear Programming (LP) can be used to solve "
-    "simplified scheduling problems. LP helps in making optimal decisions when "
-    "faced with limited resources and specific objectives."
-)
+# --- Static page text (kept at module level and rendered in one call each) ---
+INTRO_MD = r"""
+# Optimizing Scheduling with Linear Programming
 
-# --- What is a Scheduling Problem with LP? ---
-st.header("What is a Scheduling Problem Solved with Linear Programming?")
-st.markdown(
-    """
-    Scheduling problems involve allocating resources (e.g., time, personnel, machines) to tasks over a period to achieve an optimal outcome. When solved with Linear Programming, these problems are formulated mathematically, consisting of:
+---
 
-    * **Decision Variables**: Represent the choices (e.g., how many people to assign to a shift).
-    * **Objective Function**: The goal to optimize (e.g., minimize cost, maximize profit).
-    * **Constraints**: Limitations or rules that must be followed (e.g., minimum staff required, maximum working hours).
+This application demonstrates how Linear Programming (LP) can be used to solve simplified scheduling problems. LP helps in making optimal decisions when faced with limited resources and specific objectives.
 
-    By defining these components as linear expressions, LP solvers can find the best possible solution.
-    """
-)
-st.markdown("---")
+## What is a Scheduling Problem Solved with Linear Programming?
 
-# --- Example Exercise: Workforce Scheduling ---
-st.header("Example: Simplified Workforce Scheduling")
-st.write(
-    "Imagine a small café that needs to schedule its staff for a day. "
-    "They have different staffing requirements for different time slots."
-)
+Scheduling problems involve allocating resources (e.g., time, personnel, machines) to tasks over a period to achieve an optimal outcome. When solved with Linear Programming, these problems are formulated mathematically, consisting of:
 
-st.subheader("Requirements:")
-st.markdown(
-    """
-    * **Morning (8 AM - 12 PM):** At least 2 staff
-    * **Afternoon (12 PM - 4 PM)::** At least 3 staff
-    * **Evening (4 PM - 8 PM):** At least 2 staff
-    """
-)
+* **Decision Variables**: Represent the choices (e.g., how many people to assign to a shift).
+* **Objective Function**: The goal to optimize (e.g., minimize cost, maximize profit).
+* **Constraints**: Limitations or rules that must be followed (e.g., minimum staff required, maximum working hours).
 
-st.subheader("Employee Shifts:")
-st.markdown(
-    """
-    * **Shift 1 (S1):** 8 AM - 4 PM (8 hours)
-    * **Shift 2 (S2):** 12 PM - 8 PM (8 hours)
-    """
-)
+By defining these components as linear expressions, LP solvers can find the best possible solution.
 
-st.write("Each employee works one 8-hour shift. We want to minimize the total number of employees needed.")
+---
 
-st.subheader("Conceptual LP Formulation:")
-st.markdown(
-    """
-    Let:
-    * `$x_1$` = Number of employees on Shift 1
-    * `$x_2$` = Number of employees on Shift 2
-
-    **Objective Function (Minimize Total Employees):**
-    `Min Z = x1 + x2`
-
-    **Constraints:**
-    * **Morning (8 AM - 12 PM):** Employees on S1 cover this.
-        `$x_1 \ge 2$`
-    * **Afternoon (12 PM - 4 PM):** Employees on S1 and S2 cover this.
-        `$x_1 + x_2 \ge 3$`
-    * **Evening (4 PM - 8 PM):** Employees on S2 cover this.
-        `$x_2 \ge 2$`
-    * **Non-negativity:**
-        `$x_1 \ge 0, x_2 \ge 0$`
-        (Also, `$x_1$` and `$x_2$` should ideally be integers for real-world application, making it an Integer Linear Programming problem.)
-    """
-)
+## Example: Simplified Workforce Scheduling
 
-# --- Solve the problem (conceptual/illustrative) ---
-st.subheader("Illustrative Solution:")
+Imagine a small café that needs to schedule its staff for a day. They have different staffing requirements for different time slots.
+"""
 
-# Create the problem variable
-prob = LpProblem("Cafe_Staffing", LpMinimize)
+SHIFTS_MD = """
+### Employee Shifts:
 
-# Decision Variables
-x1 = LpVariable("Shift1_Employees", 0, None, LpInteger)
-x2 = LpVariable("Shift2_Employees", 0, None, LpInteger)
+* **Shift 1 (S1):** 8 AM - 4 PM (8 hours)
+* **Shift 2 (S2):** 12 PM - 8 PM (8 hours)
 
-# Objective Function
-prob += x1 + x2, "Total_Employees"
+Each employee works one 8-hour shift. We want to minimize the total number of employees needed.
+"""
 
-# Constraints
-prob += x1 >= 2, "Morning_Coverage"
-prob += x1 + x2 >= 3, "Afternoon_Coverage"
-prob += x2 >= 2, "Evening_Coverage"
+USES_MD = """
+*(This is a simplified example. Real-world scheduling problems involve many more variables and constraints.)*
 
-# Solve the problem
-prob.solve()
+---
 
-optimal_x1 = None
-optimal_x2 = None
-optimal_obj_val = None
+## Top 10 Uses of Linear Programming in Scheduling
 
-if LpStatus[prob.status] == "Optimal":
-    st.success(f"**Optimal Solution Found!** (Status: {LpStatus[prob.status]})")
-    optimal_x1 = x1.varValue
-    optimal_x2 = x2.varValue
-    optimal_obj_val = value(prob.objective)
-    st.write(f"Number of employees for Shift 1: **{int(optimal_x1)}**")
-    st.write(f"Number of employees for Shift 2: **{int(optimal_x2)}**")
-    st.write(f"**Minimum Total Employees Needed: {int(optimal_obj_val)}**")
-else:
-    st.warning(f"No optimal solution found. Status: {LpStatus[prob.status]}")
+Here are key areas where Linear Programming is applied to optimize scheduling:
 
-st.write(
-    "*(This is a simplified example. Real-world scheduling problems involve many more variables and constraints.)*"
-)
-st.markdown("---")
+1.  **Staff/Workforce Scheduling**: Minimizing labor costs while meeting demand and adhering to labor laws, employee preferences, and skill requirements (e.g., nurse scheduling in hospitals, call center staffing, bus driver rosters).
+2.  **Production Planning and Scheduling**: Optimizing production runs to meet demand, minimize inventory costs, and efficiently utilize machinery and raw materials.
+3.  **Transportation and Logistics Scheduling**: Determining optimal routes and schedules for fleets of vehicles (e.g., delivery trucks, airlines) to minimize fuel consumption, travel time, or maximize deliveries.
+4.  **Resource Allocation**: Distributing limited resources (e.g., budget, equipment, raw materials) among competing projects or tasks to achieve specific objectives.
+5.  **Project Scheduling**: Optimizing the timeline and resource allocation for complex projects to meet deadlines and minimize costs.
+6.  **Energy Management Scheduling**: Planning the operation of power plants or energy consumption in industrial facilities to minimize costs or carbon emissions.
+7.  **Machine Scheduling**: Optimizing the sequence of jobs on machines to minimize completion time, maximize throughput, or reduce setup costs.
+8.  **Classroom/University Timetabling**: Creating optimal class schedules that accommodate student and instructor preferences, room availability, and minimize conflicts.
+9.  **Maintenance Scheduling**: Planning maintenance activities for equipment or infrastructure to minimize downtime and extend asset life.
+10. **Event Scheduling**: Optimizing the timing and resource allocation for large-scale events, conferences, or sports tournaments to manage venues, staff, and participant flow.
 
-# Removed: Feasible Region Graph Section
-# All code related to matplotlib plotting was removed from here.
+---
+"""
 
-# --- Top 10 Uses Section ---
-st.header("Top 10 Uses of Linear Programming in Scheduling")
-st.markdown(
-    """
-    Here are key areas where Linear Programming is applied to optimize scheduling:
-
-    1.  **Staff/Workforce Scheduling**: Minimizing labor costs while meeting demand and adhering to labor laws, employee preferences, and skill requirements (e.g., nurse scheduling in hospitals, call center staffing, bus driver rosters).
-    2.  **Production Planning and Scheduling**: Optimizing production runs to meet demand, minimize inventory costs, and efficiently utilize machinery and raw materials.
-    3.  **Transportation and Logistics Scheduling**: Determining optimal routes and schedules for fleets of vehicles (e.g., delivery trucks, airlines) to minimize fuel consumption, travel time, or maximize deliveries.
-    4.  **Resource Allocation**: Distributing limited resources (e.g., budget, equipment, raw materials) among competing projects or tasks to achieve specific objectives.
-    5.  **Project Scheduling**: Optimizing the timeline and resource allocation for complex projects to meet deadlines and minimize costs.
-    6.  **Energy Management Scheduling**: Planning the operation of power plants or energy consumption in industrial facilities to minimize costs or carbon emissions.
-    7.  **Machine Scheduling**: Optimizing the sequence of jobs on machines to minimize completion time, maximize throughput, or reduce setup costs.
-    8.  **Classroom/University Timetabling**: Creating optimal class schedules that accommodate student and instructor preferences, room availability, and minimize conflicts.
-    9.  **Maintenance Scheduling**: Planning maintenance activities for equipment or infrastructure to minimize downtime and extend asset life.
-    10. **Event Scheduling**: Optimizing the timing and resource allocation for large-scale events, conferences, or sports tournaments to manage venues, staff, and participant flow.
+# --- Introduction and LP formulation ---
+st.markdown(INTRO_MD)
+
+
+# Constraint names, in the same order as the slider values passed to _solve_cafe
+_COVERAGE = ("Morning_Coverage", "Afternoon_Coverage", "Evening_Coverage")
+
+
+def _solve_cafe(morning_min, afternoon_min, evening_min):
+    """Solve the café staffing LP; returns (status, x1, x2, Z).
+
+    The model is built once per session and kept in st.session_state; later
+    calls only change the constraint right-hand sides and re-solve when the
+    requirements actually differ from the last solve.
     """
+    # Imported lazily so reruns that never tick the solver checkbox skip PuLP
+    from pulp import (
+        HiGHS, LpAffineExpression, LpConstraint, LpConstraintGE, LpInteger,
+        LpMinimize, LpProblem, LpStatus, LpVariable, value,
+    )
+
+    if "cafe_model" not in st.session_state:
+        # Create the problem variable
+        prob = LpProblem("Cafe_Staffing", LpMinimize)
+
+        # Decision Variables
+        x1 = LpVariable("Shift1_Employees", 0, None, LpInteger)
+        x2 = LpVariable("Shift2_Employees", 0, None, LpInteger)
+
+        # Objective Function
+        prob += x1 + x2, "Total_Employees"
+
+        # Constraints (built directly to skip the expression copies made by >=)
+        prob.addConstraint(LpConstraint(
+            LpAffineExpression([(x1, 1)]), LpConstraintGE, "Morning_Coverage", morning_min
+        ))
+        prob.addConstraint(LpConstraint(
+            LpAffineExpression([(x1, 1), (x2, 1)]), LpConstraintGE, "Afternoon_Coverage", afternoon_min
+        ))
+        prob.addConstraint(LpConstraint(
+            LpAffineExpression([(x2, 1)]), LpConstraintGE, "Evening_Coverage", evening_min
+        ))
+
+        st.session_state.cafe_model = (prob, x1, x2)
+        st.session_state.cafe_rhs = None
+
+    prob, x1, x2 = st.session_state.cafe_model
+    rhs = (morning_min, afternoon_min, evening_min)
+
+    if st.session_state.cafe_rhs != rhs:
+        for name, minimum in zip(_COVERAGE, rhs):
+            prob.constraints[name].changeRHS(minimum)
+
+        # Solve the problem in-process with HiGHS (no CBC subprocess or temp files)
+        prob.solve(HiGHS(msg=False))
+
+        st.session_state.cafe_rhs = rhs
+        st.session_state.cafe_result = (
+            LpStatus[prob.status], x1.varValue, x2.varValue, value(prob.objective)
+        )
+
+    return st.session_state.cafe_result
+
+
+# --- Requirements and LP formulation (follow the sliders) ---
+st.markdown("### Requirements:")
+st.write("Adjust the minimum staff for each time slot to see how the optimum changes.")
+morning_min = st.slider("Morning minimum staff", 0, 10, 2)
+afternoon_min = st.slider("Afternoon minimum staff", 0, 10, 3)
+evening_min = st.slider("Evening minimum staff", 0, 10, 2)
+
+st.markdown(
+    f"""
+* **Morning (8 AM - 12 PM):** At least {morning_min} staff
+* **Afternoon (12 PM - 4 PM):** At least {afternoon_min} staff
+* **Evening (4 PM - 8 PM):** At least {evening_min} staff
+"""
+)
+st.markdown(SHIFTS_MD)
+st.markdown(
+    rf"""
+### Conceptual LP Formulation:
+
+Let:
+* `$x_1$` = Number of employees on Shift 1
+* `$x_2$` = Number of employees on Shift 2
+
+**Objective Function (Minimize Total Employees):**
+`Min Z = x1 + x2`
+
+**Constraints:**
+* **Morning (8 AM - 12 PM):** Employees on S1 cover this.
+    `$x_1 \ge {morning_min}$`
+* **Afternoon (12 PM - 4 PM):** Employees on S1 and S2 cover this.
+    `$x_1 + x_2 \ge {afternoon_min}$`
+* **Evening (4 PM - 8 PM):** Employees on S2 cover this.
+    `$x_2 \ge {evening_min}$`
+* **Non-negativity:**
+    `$x_1 \ge 0, x_2 \ge 0$`
+    (Also, `$x_1$` and `$x_2$` should ideally be integers for real-world application, making it an Integer Linear Programming problem.)
+"""
 )
-st.markdown("---")
+
+st.markdown("### Illustrative Solution:")
+
+# Closed-form optimum: only S1 covers the morning and only S2 covers the
+# evening, so each shift sits at its lower bound unless the afternoon needs more.
+optimal_x1 = morning_min
+optimal_x2 = max(evening_min, afternoon_min - optimal_x1)
+optimal_obj_val = optimal_x1 + optimal_x2
+
+st.success("**Optimal Solution Found!** (by inspection of the constraints)")
+st.write(f"Number of employees for Shift 1: **{optimal_x1}**")
+st.write(f"Number of employees for Shift 2: **{optimal_x2}**")
+st.write(f"**Minimum Total Employees Needed: {optimal_obj_val}**")
+
+if st.checkbox("Run actual LP solver"):
+    status, x1_val, x2_val, obj_val = _solve_cafe(morning_min, afternoon_min, evening_min)
+    if status == "Optimal":
+        st.success(f"**LP Solver Solution Found!** (Status: {status})")
+        st.write(f"Number of employees for Shift 1: **{int(x1_val)}**")
+        st.write(f"Number of employees for Shift 2: **{int(x2_val)}**")
+        st.write(f"**Minimum Total Employees Needed: {int(obj_val)}**")
+        if int(obj_val) == optimal_obj_val:
+            st.info(
+                "The solver's total matches the closed-form answer. When several staffing "
+                "splits tie for the same minimum total, the solver may pick a different "
+                "split; only the total has to agree."
+            )
+        else:
+            st.warning(
+                f"The solver's total ({int(obj_val)}) differs from the closed-form answer "
+                f"({optimal_obj_val})."
+            )
+    else:
+        st.warning(f"No optimal solution found. Status: {status}")
+
+# --- Top 10 Uses Section ---
+st.markdown(USES_MD)